@@ -2,6 +2,7 @@
 Command-line interface for the job automation application.
 """
 import argparse
+import compileall
 import sys
 import os
 from datetime import datetime
@@ -41,6 +42,18 @@ def init_command(args):
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         sys.exit(1)
+    
+    # Precompile the project modules so later cold starts skip bytecode compilation,
+    # unless the user opted out of .pyc files (compileall ignores that setting itself)
+    if sys.dont_write_bytecode:
+        logger.info("Bytecode writing disabled, skipping module precompilation")
+        return
+    
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    if compileall.compile_dir(project_dir, maxlevels=0, quiet=1):
+        logger.info("Project modules precompiled")
+    else:
+        logger.warning("Some project modules could not be precompiled")
 
 def status_command(args):
     """Show system status."""
@@ -85,7 +98,7 @@ def post_command(args):
     """Manually trigger content posting."""
     try:
         logger.info(f"Starting manual posting for platform: {args.platform or 'all'}")
-        orchestrator = JobAutomationOrchestrator(args.config)
+        orchestrator = JobAutomationOrchestrator(args.config, prewarm_posters=True)
         orchestrator.run_manual_posting(args.platform)
         logger.success("Manual posting completed")
         
@@ -203,7 +216,7 @@ def start_command(args):
     """Start the orchestrator."""
     try:
         logger.info("Starting Job Automation Orchestrator...")
-        orchestrator = JobAutomationOrchestrator(args.config)
+        orchestrator = JobAutomationOrchestrator(args.config, prewarm_posters=True)
         orchestrator.start()
         
     except KeyboardInterrupt:
@@ -3,8 +3,7 @@ Main orchestrator for the job automation application.
 """
 import os
 import time
-import random
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from loguru import logger
 import yaml
@@ -25,14 +24,19 @@ from job_fetchers import JobFetcherManager
 from job_processor import JobProcessor
 from caption_generator import CaptionGenerator
 from image_generator import ImageGenerationManager
-from social_posters import SocialPosterManager
+from social_posters import get_manager
 
 class JobAutomationOrchestrator:
     """Main orchestrator for job automation workflow."""
     
-    def __init__(self, config_path: str = "config.yaml"):
-        """Initialize the orchestrator."""
+    def __init__(self, config_path: str = "config.yaml", prewarm_posters: bool = False):
+        """Initialize the orchestrator.
+        
+        With prewarm_posters=True, the posting browsers start in the background
+        while the rest of the setup runs.
+        """
         self.config_path = config_path
+        self.prewarm_posters = prewarm_posters
         with open(config_path, 'r') as file:
             self.config = yaml.safe_load(file)
         
@@ -64,7 +68,7 @@ class JobAutomationOrchestrator:
             self.image_generation_manager = ImageGenerationManager(self.config_path)
             
             # Initialize social media posters
-            self.social_poster_manager = SocialPosterManager(self.config_path)
+            self.social_poster_manager = get_manager(self.config_path, prewarm=self.prewarm_posters)
             
             logger.info("All components initialized successfully")
             
@@ -311,12 +315,22 @@ class JobAutomationOrchestrator:
             # Process pending posts
             posts_to_process = pending_posts[:max_posts - today_posts]
             logger.info(f"Processing {len(posts_to_process)} posts (limit: {max_posts - today_posts})")
+            jobs_collection = db.get_collection('jobs_clean')
+            from bson import ObjectId
+            
+            # Use the applybutton.gif file as the image
+            image_path = "applybutton.gif"
+            if os.path.exists(image_path):
+                logger.info("Using applybutton.gif as the post image")
+            else:
+                logger.warning(f"applybutton.gif not found, posting without image")
+                image_path = None
+            
+            batch = []
             for i, post in enumerate(posts_to_process):
                 try:
                     logger.info(f"Processing post {i+1}/{len(posts_to_process)}: {post.get('_id', 'Unknown')}")
                     # Get job data
-                    jobs_collection = db.get_collection('jobs_clean')
-                    from bson import ObjectId
                     job = jobs_collection.find_one({'_id': ObjectId(post['job_id'])})
                     if not job:
                         logger.warning(f"Job not found for post {post.get('_id', 'Unknown')}")
@@ -334,54 +348,38 @@ class JobAutomationOrchestrator:
                         'seniority': job.get('seniority'),
                         'employment_type': job.get('employment_type')
                     }
-                    
-                    # Use the applybutton.gif file as the image
-                    image_path = "applybutton.gif"
-                    if os.path.exists(image_path):
-                        logger.info(f"Using applybutton.gif for job: {job_data.get('title', 'Unknown')}")
-                    else:
-                        logger.warning(f"applybutton.gif not found, posting without image")
-                        image_path = None
-                    
-                    # Post to social media with image
-                    captions = {post['platform']: post['caption']}
-                    results = self.social_poster_manager.post_to_all_platforms(captions, job_data, image_path)
-                    
-                    # Update post status
-                    if results.get(post['platform'], (False, None))[0]:
-                        # Update post status to posted
-                        posts_collection.update_one(
-                            {'_id': post['_id']}, 
-                            {'$set': {'status': 'posted'}}
-                        )
-                        
-                        # Create posted item record
-                        posted_items_collection = db.get_collection('posted_items')
-                        posted_item = {
-                            'job_id': post['job_id'],
-                            'platform': post['platform'],
-                            'posted_at': datetime.utcnow(),
-                            'external_post_id': results[post['platform']][1]
-                        }
-                        posted_items_collection.insert_one(posted_item)
-                        
-                        logger.info(f"Successfully posted to {post['platform']}: {job.get('title', 'Unknown')}")
-                    else:
-                        # Update post status to failed
-                        posts_collection.update_one(
-                            {'_id': post['_id']}, 
-                            {'$set': {'status': 'failed'}}
-                        )
-                        logger.error(f"Failed to post to {post['platform']}: {job.get('title', 'Unknown')}")
-                    
-                    # Add delay between posts
-                    time.sleep(random.uniform(30, 90))
+                    batch.append((post, job, {post['platform']: post['caption']}, job_data))
                     
                 except Exception as e:
-                    logger.error(f"Error posting content: {e}")
-                    post.status = 'failed'
+                    logger.error(f"Error preparing post: {e}")
                     continue
             
+            if not batch:
+                logger.info("No posts left to publish")
+                return
+            
+            saved = set()
+            
+            def save_result(index, result_platform, result):
+                # Record each post as soon as it is published, so a crash mid-batch can't repost it
+                post, job, _, _ = batch[index]
+                if result_platform == post['platform']:
+                    self._save_post_result(db, post, job, result)
+                    saved.add(index)
+            
+            # Post to social media with image, in one browser session per platform
+            # with a delay between posts
+            self.social_poster_manager.post_batch(
+                [(captions, job_data, image_path) for _, _, captions, job_data in batch],
+                delay_range=(30, 90),
+                on_result=save_result
+            )
+            
+            # Posts whose platform has no poster (or whose batch failed outright) never reported back
+            for index, (post, job, _, _) in enumerate(batch):
+                if index not in saved:
+                    self._save_post_result(db, post, job, (False, None))
+            
             logger.info(f"Content posting cycle completed")
             
         except Exception as e:
@@ -389,6 +387,41 @@ class JobAutomationOrchestrator:
         finally:
             db.close()
     
+    def _save_post_result(self, db, post: Dict[str, Any], job: Dict[str, Any], result: Tuple[bool, Optional[str]]):
+        """Mark a pending post as posted or failed, recording a posted item on success."""
+        posts_collection = db.get_collection('posts_ready')
+        success, external_post_id = result
+        try:
+            # Update post status
+            if success:
+                # Update post status to posted
+                posts_collection.update_one(
+                    {'_id': post['_id']}, 
+                    {'$set': {'status': 'posted'}}
+                )
+                
+                # Create posted item record
+                posted_items_collection = db.get_collection('posted_items')
+                posted_item = {
+                    'job_id': post['job_id'],
+                    'platform': post['platform'],
+                    'posted_at': datetime.utcnow(),
+                    'external_post_id': external_post_id
+                }
+                posted_items_collection.insert_one(posted_item)
+                
+                logger.info(f"Successfully posted to {post['platform']}: {job.get('title', 'Unknown')}")
+            else:
+                # Update post status to failed
+                posts_collection.update_one(
+                    {'_id': post['_id']}, 
+                    {'$set': {'status': 'failed'}}
+                )
+                logger.error(f"Failed to post to {post['platform']}: {job.get('title', 'Unknown')}")
+                
+        except Exception as e:
+            logger.error(f"Error saving post result: {e}")
+    
     def _get_today_post_count(self, db, platform: Optional[str] = None) -> int:
         """Get the number of posts made today."""
         today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
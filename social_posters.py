@@ -4,20 +4,27 @@ Social media posting automation for LinkedIn.
 import os
 import time
 import random
-from typing import Dict, List, Any, Optional, Tuple
+import re
+import json
+import pickle
+import subprocess
+import shutil
+import tempfile
+import atexit
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from loguru import logger
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from tenacity import retry, stop_after_attempt, wait_exponential
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Load environment variables from .env file
 try:
     from dotenv import load_dotenv
@@ -26,6 +33,235 @@ try:
 except ImportError:
     logger.warning("python-dotenv not installed, environment variables may not be loaded")
 
+# Selenium and webdriver_manager are imported on first LinkedInPoster creation
+# (see _import_selenium) so importing this module stays cheap
+webdriver = None
+By = None
+WebDriverWait = None
+EC = None
+Options = None
+Service = None
+TimeoutException = None
+ElementClickInterceptedException = None
+StaleElementReferenceException = None
+SessionNotCreatedException = None
+ChromeDriverManager = None
+DriverCacheManager = None
+
+def _import_selenium():
+    """Import the Selenium stack into module globals on first use."""
+    global webdriver, By, WebDriverWait, EC, Options, Service
+    global TimeoutException, ElementClickInterceptedException, StaleElementReferenceException
+    global SessionNotCreatedException
+    global ChromeDriverManager, DriverCacheManager
+    
+    if webdriver is not None:
+        return
+    
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.common.exceptions import (
+        TimeoutException, ElementClickInterceptedException, StaleElementReferenceException,
+        SessionNotCreatedException
+    )
+    from webdriver_manager.chrome import ChromeDriverManager
+    from webdriver_manager.core.driver_cache import DriverCacheManager
+
+# Locator strategies, equal to selenium's By.CSS_SELECTOR / By.XPATH so the
+# locator tables below can be built without importing Selenium
+_CSS = "css selector"
+_XPATH = "xpath"
+
+# Candidate locators for each LinkedIn element, most specific first. The
+# *_FALLBACK_LOCATORS are catch-alls that are only tried once the specific
+# ones have timed out, and are never remembered as the resolved selector
+_START_POST_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_CSS, "button.artdeco-button--muted.artdeco-button--tertiary"),
+    (_CSS, "div[data-placeholder='Start a post']"),
+    (_CSS, "div[aria-label='Start a post']"),
+    (_CSS, "div[data-control-name='share.open']"),
+    (_CSS, "div[data-control-name='create_post']"),
+    (_CSS, "div[role='textbox'][data-placeholder*='post']"),
+    (_CSS, "div[contenteditable='true'][data-placeholder*='post']"),
+)
+_START_POST_TEXT_XPATH = "//div[contains(text(), 'Start a post') or contains(@data-placeholder, 'Start a post')]"
+_LOWERCASE_TEXT = "translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_START_POST_ANY_XPATH = (
+    f"//*[contains({_LOWERCASE_TEXT}, 'start a post') or contains({_LOWERCASE_TEXT}, 'create a post')]"
+)
+
+_POST_TEXTAREA_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_CSS, "div[data-placeholder='What do you want to talk about?']"),
+    (_CSS, "div[aria-label='Text editor for creating content']"),
+    (_CSS, "div[contenteditable='true'][data-placeholder*='talk about']"),
+    (_CSS, "div[contenteditable='true'][data-placeholder*='want to']"),
+    (_CSS, "div[role='textbox'][data-placeholder*='talk']"),
+)
+_POST_TEXTAREA_FALLBACK_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_CSS, "div[contenteditable='true']"),
+    (_CSS, "div[role='textbox']"),
+)
+_POST_TEXTAREA_XPATH = "//div[contains(@data-placeholder, 'What do you want to talk about') or contains(@data-placeholder, 'talk about')]"
+
+_MEDIA_BUTTON_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_CSS, "button[aria-label='Add media']"),
+    (_CSS, "button[aria-label='Photo']"),
+    (_CSS, "button[aria-label='Add a photo']"),
+    (_CSS, "button[data-control-name='share.add_photo']"),
+    (_CSS, "button[data-control-name='share.add_media']"),
+    (_CSS, "div[data-control-name='share.add_photo']"),
+)
+_MEDIA_BUTTON_FALLBACK_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_CSS, "button:contains('Photo')"),
+    (_CSS, "button:contains('Add a photo')"),
+)
+_PHOTO_BUTTON_XPATH = "//button[contains(text(), 'Photo') or contains(text(), 'photo')]"
+
+_FILE_INPUT_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_CSS, "input#media-editor-file-selector_file-input"),
+)
+_FILE_INPUT_FALLBACK_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_CSS, "input[type='file']"),
+)
+
+_NEXT_BUTTON_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_CSS, "div.share-box-footer.main-actions button[aria-label='Next']"),
+    (_CSS, "button.share-box-footer_primary-btn"),
+    (_XPATH, "//div[contains(@class, 'share-box-footer')]//button[contains(text(), 'Next')]"),
+)
+_NEXT_BUTTON_FALLBACK_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_XPATH, "//button[contains(text(), 'Next')]"),
+    (_XPATH, "//button[contains(text(), 'Next') or contains(@aria-label, 'Next')]"),
+)
+
+_POST_BUTTON_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_CSS, "button.share-actions__primary-action"),
+    (_CSS, "button[aria-label='Post']"),
+    (_CSS, "button[data-control-name='share.post']"),
+    (_CSS, "button[data-control-name='share.post_button']"),
+)
+_POST_BUTTON_FALLBACK_LOCATORS: Tuple[Tuple[str, str], ...] = (
+    (_XPATH, "//button[contains(text(), 'Post') or contains(@aria-label, 'Post')]"),
+    (_CSS, "button:contains('Post')"),
+    (_CSS, "button[type='submit']"),
+)
+
+# Characters outside the Basic Multilingual Plane, which ChromeDriver can't type
+_NON_BMP_RE = re.compile(r'[^\u0000-\uffff]')
+
+# State persisted across runs (session cookies, resolved chromedriver path)
+JOBHUNT_STATE_DIR = os.path.expanduser("~/.jobhunt")
+LINKEDIN_COOKIE_PATH = os.path.join(JOBHUNT_STATE_DIR, "linkedin_cookies.pkl")
+CHROMEDRIVER_CACHE_PATH = os.path.join(JOBHUNT_STATE_DIR, "chromedriver_cache.json")
+CHROME_PROFILE_DIR = os.path.join(JOBHUNT_STATE_DIR, "chrome-profile")
+
+# How long a confirmed LinkedIn login is trusted before the session cookie is re-checked
+LOGIN_CHECK_TTL_SECONDS = 600
+
+# Attempts made by post_content when the page changes under a click
+POST_ATTEMPTS = 3
+
+# Chromedriver path already resolved by this process
+_CHROMEDRIVER_PATH: Optional[str] = None
+
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime: float) -> dict:
+    """Parse a YAML config file; cached per (path, mtime) so edits are picked up."""
+    with open(config_path, 'r') as file:
+        return yaml.load(file, Loader=_YamlLoader)
+
+def _load_config(config_path: str) -> dict:
+    """Load a YAML config file, reusing the parsed result while the file is unchanged."""
+    return _parse_config(config_path, os.path.getmtime(config_path))
+
+def _ensure_state_dir():
+    """Create the state directory, readable only by the current user (it holds session cookies)."""
+    os.makedirs(JOBHUNT_STATE_DIR, mode=0o700, exist_ok=True)
+    os.chmod(JOBHUNT_STATE_DIR, 0o700)
+
+def _get_chrome_major_version() -> Optional[str]:
+    """Return the installed Chrome major version, or None if it can't be determined."""
+    if os.name == "nt":
+        return _get_windows_chrome_major_version()
+    return _get_major_version("google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+                              "/opt/google/chrome/chrome",
+                              "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
+
+def _get_windows_chrome_major_version() -> Optional[str]:
+    """Return Chrome's major version from the registry (chrome.exe --version prints nothing on Windows)."""
+    import winreg
+    
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                version, _ = winreg.QueryValueEx(key, "version")
+        except OSError:
+            continue
+        match = re.match(r"(\d+)\.", str(version))
+        if match:
+            return match.group(1)
+    return None
+
+def _get_major_version(*binaries: str) -> Optional[str]:
+    """Return the major version reported by the first of binaries that runs, or None."""
+    for binary in binaries:
+        try:
+            output = subprocess.check_output([binary, "--version"], stderr=subprocess.DEVNULL, timeout=5)
+        except Exception:
+            continue
+        match = re.search(r"(\d+)\.", output.decode(errors="ignore"))
+        if match:
+            return match.group(1)
+    return None
+
+def _resolve_chromedriver_path() -> str:
+    """Return a chromedriver path, resolving it at most once per process."""
+    global _CHROMEDRIVER_PATH
+    if _CHROMEDRIVER_PATH is None or not os.access(_CHROMEDRIVER_PATH, os.X_OK):
+        _CHROMEDRIVER_PATH = _find_chromedriver_path()
+    return _CHROMEDRIVER_PATH
+
+def _find_chromedriver_path() -> str:
+    """Return a chromedriver path, reusing the cached one for the installed Chrome version."""
+    chrome_major = _get_chrome_major_version()
+    
+    cache = {}
+    if chrome_major and os.path.exists(CHROMEDRIVER_CACHE_PATH):
+        try:
+            with open(CHROMEDRIVER_CACHE_PATH, 'r') as file:
+                cache = json.load(file)
+        except Exception as e:
+            logger.warning(f"Failed to read chromedriver cache: {e}")
+        
+        cached_path = cache.get(chrome_major)
+        if cached_path and os.access(cached_path, os.X_OK):
+            logger.info(f"Using cached chromedriver for Chrome {chrome_major}: {cached_path}")
+            return cached_path
+    
+    # A chromedriver on PATH that matches the installed Chrome needs no download at all
+    path_driver = shutil.which("chromedriver")
+    if chrome_major and path_driver and _get_major_version(path_driver) == chrome_major:
+        logger.info(f"Using chromedriver from PATH for Chrome {chrome_major}: {path_driver}")
+        return path_driver
+    
+    # Fall back to webdriver manager, trusting its own download cache for a week
+    driver_path = ChromeDriverManager(cache_manager=DriverCacheManager(valid_range=7)).install()
+    
+    if chrome_major:
+        cache[chrome_major] = driver_path
+        try:
+            _ensure_state_dir()
+            with open(CHROMEDRIVER_CACHE_PATH, 'w') as file:
+                json.dump(cache, file)
+        except Exception as e:
+            logger.warning(f"Failed to write chromedriver cache: {e}")
+    
+    return driver_path
+
 class BaseSocialPoster:
     """Base class for social media posters."""
     
@@ -38,6 +274,31 @@ class BaseSocialPoster:
         """Post content to the platform. Override in subclasses."""
         raise NotImplementedError
     
+    def post_batch(self, items: List[Tuple[str, Dict[str, Any], Optional[str]]],
+                   delay_range: Tuple[float, float] = (0, 0),
+                   on_result: Optional[Callable[[int, Tuple[bool, Optional[str]]], None]] = None
+                   ) -> List[Tuple[bool, Optional[str]]]:
+        """Post a list of (caption, job_data, image_path) items, pausing delay_range seconds between them.
+        
+        on_result(index, result) is called as soon as each item is done. Override for session reuse.
+        """
+        results = []
+        for index, (caption, job_data, image_path) in enumerate(items):
+            if index and delay_range[1] > 0:
+                self._add_random_delay(*delay_range)
+            self._record_result(results, self.post_content(caption, job_data, image_path), on_result)
+        return results
+    
+    def _record_result(self, results: List[Tuple[bool, Optional[str]]], result: Tuple[bool, Optional[str]],
+                       on_result: Optional[Callable[[int, Tuple[bool, Optional[str]]], None]]):
+        """Append result to results and report it to on_result, if given."""
+        results.append(result)
+        if on_result:
+            try:
+                on_result(len(results) - 1, result)
+            except Exception as e:
+                logger.error(f"Error handling post result: {e}")
+    
     def _add_random_delay(self, min_delay: float = 1.0, max_delay: float = 3.0):
         """Add random delay to avoid detection."""
         delay = random.uniform(min_delay, max_delay)
@@ -56,34 +317,171 @@ class LinkedInPoster(BaseSocialPoster):
         
         self.driver = None
         self.wait = None
+        self._temp_profile_dir: Optional[str] = None
+        self._resolved_selectors: Dict[str, Tuple[str, str]] = {}
+        self._login_verified_at: Optional[float] = None
+        _import_selenium()
         self._setup_driver()
     
     def _setup_driver(self):
         """Setup Chrome driver with appropriate options."""
         try:
-            chrome_options = Options()
-            
-            # Add options to avoid detection
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option('useAutomationExtension', False)
-            
-            # Use webdriver manager to handle driver installation
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Use webdriver manager to handle driver installation (cached per Chrome version)
+            service = Service(_resolve_chromedriver_path(), log_output=subprocess.DEVNULL)
+            try:
+                self.driver = webdriver.Chrome(service=service, options=self._chrome_options(CHROME_PROFILE_DIR))
+            except SessionNotCreatedException as e:
+                # Chrome allows one browser per profile, so another running instance
+                # (e.g. the scheduler) keeps us off the shared one; cached cookies cover the login
+                if "user data directory is already in use" not in (e.msg or ""):
+                    raise
+                logger.warning("Shared Chrome profile is in use by another browser, using a temporary profile")
+                self._temp_profile_dir = tempfile.mkdtemp(prefix="jobhunt-chrome-")
+                try:
+                    service = Service(_resolve_chromedriver_path(), log_output=subprocess.DEVNULL)
+                    self.driver = webdriver.Chrome(service=service, options=self._chrome_options(self._temp_profile_dir))
+                except Exception:
+                    # close() never runs for a poster that failed to start
+                    shutil.rmtree(self._temp_profile_dir, ignore_errors=True)
+                    self._temp_profile_dir = None
+                    raise
             
             # Execute script to avoid detection
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
             
-            self.wait = WebDriverWait(self.driver, 20)
+            self.wait = WebDriverWait(self.driver, 10)
             logger.info("LinkedIn Chrome driver setup completed")
             
         except Exception as e:
             logger.error(f"Failed to setup LinkedIn driver: {e}")
             raise
     
+    def _chrome_options(self, profile_dir: str):
+        """Build the Chrome options, using profile_dir as the browser profile."""
+        chrome_options = Options()
+        
+        # Add options to avoid detection
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+        
+        # Keep a persistent profile so the LinkedIn session survives between runs
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument("--profile-directory=Default")
+        
+        # Run headless unless posting.headless is disabled (useful for debugging)
+        if self.posting_config.get('headless', True):
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+            chrome_options.add_argument("--window-size=1280,900")
+        
+        # Skip image/notification loading to cut LinkedIn page weight
+        # (uploading our own image goes through the file input, so it is unaffected)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-notifications")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        
+        # Return from driver.get() on DOMContentLoaded; explicit waits cover the rest
+        chrome_options.page_load_strategy = "eager"
+        
+        return chrome_options
+    
+    def _wait_for(self, condition, timeout: float = 15, poll: float = 0.1):
+        """Wait until condition holds, polling every poll seconds."""
+        return WebDriverWait(self.driver, timeout, poll_frequency=poll).until(condition)
+    
+    def _find_first(self, role: str, locators: Tuple[Tuple[str, str], ...],
+                    fallbacks: Tuple[Tuple[str, str], ...] = (), condition=None, timeout: float = 8):
+        """Return the first element matched by locators, trying the selector that worked last time first.
+        
+        fallbacks are only tried, briefly, once every locator has timed out.
+        """
+        condition = condition or EC.element_to_be_clickable
+        
+        cached = self._resolved_selectors.get(role)
+        if cached:
+            try:
+                return self._wait_for(condition(cached), timeout=2)
+            except Exception:
+                logger.info(f"Cached selector for {role} no longer matches, trying all candidates")
+                del self._resolved_selectors[role]
+        
+        # Poll every specific candidate in one wait; any_of returns the first match in locator order
+        element, locator = self._find_any(locators, condition, timeout)
+        if element:
+            self._resolved_selectors[role] = locator
+            logger.info(f"Found {role} element with selector: {locator[1]}")
+            return element
+        
+        if fallbacks:
+            element, locator = self._find_any(fallbacks, condition, timeout=2)
+            if element:
+                logger.info(f"Found {role} element with fallback selector: {locator[1]}")
+                return element
+        return None
+    
+    def _find_any(self, locators: Tuple[Tuple[str, str], ...], condition, timeout: float):
+        """Wait for any of locators to satisfy condition; return (element, locator) or (None, None)."""
+        matched = []
+        
+        def tracked(locator):
+            check = condition(locator)
+            def predicate(driver):
+                element = check(driver)
+                if element:
+                    matched.append(locator)
+                return element
+            return predicate
+        
+        try:
+            element = self._wait_for(EC.any_of(*[tracked(locator) for locator in locators]), timeout=timeout)
+        except TimeoutException:
+            return None, None
+        return element, matched[-1]
+    
+    def _load_cookies(self) -> bool:
+        """Inject cached LinkedIn session cookies into the browser, if any.
+        
+        Must be called with a LinkedIn page loaded, since cookies can only be
+        set for the current domain. Returns True if cookies were injected.
+        """
+        if not os.path.exists(LINKEDIN_COOKIE_PATH):
+            return False
+        
+        try:
+            with open(LINKEDIN_COOKIE_PATH, 'rb') as file:
+                cookies = pickle.load(file)
+            for cookie in cookies:
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    continue
+            self.driver.refresh()
+            logger.info(f"Loaded {len(cookies)} cached LinkedIn cookies")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to load cached LinkedIn cookies: {e}")
+            return False
+    
+    def _save_cookies(self):
+        """Persist the current LinkedIn session cookies for later runs."""
+        try:
+            _ensure_state_dir()
+            # The li_at session token is in here, so never let the file be group/world readable
+            fd = os.open(LINKEDIN_COOKIE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'wb') as file:
+                os.chmod(LINKEDIN_COOKIE_PATH, 0o600)
+                pickle.dump(self.driver.get_cookies(), file)
+            logger.info(f"LinkedIn session cookies saved to {LINKEDIN_COOKIE_PATH}")
+        except Exception as e:
+            logger.warning(f"Failed to save LinkedIn cookies: {e}")
+    
     def _login(self) -> bool:
         """Login to LinkedIn."""
         try:
@@ -91,32 +489,36 @@ class LinkedInPoster(BaseSocialPoster):
             
             # Navigate to LinkedIn login page
             self.driver.get("https://www.linkedin.com/login")
-            self._add_random_delay(2, 4)
             
             # Enter email
-            email_field = self.wait.until(
+            email_field = self._wait_for(
                 EC.presence_of_element_located((By.ID, "username"))
             )
             email_field.clear()
             email_field.send_keys(self.email)
-            self._add_random_delay(1, 2)
+            self._add_random_delay(0.1, 0.3)
             
             # Enter password
             password_field = self.driver.find_element(By.ID, "password")
             password_field.clear()
             password_field.send_keys(self.password)
-            self._add_random_delay(1, 2)
+            self._add_random_delay(0.1, 0.3)
             
             # Click sign in button
             sign_in_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             sign_in_button.click()
             
             # Wait for login to complete
-            self._add_random_delay(3, 5)
+            try:
+                self._wait_for(EC.any_of(EC.url_contains("feed"), EC.url_contains("mynetwork")))
+            except TimeoutException:
+                pass
             
             # Check if login was successful
             if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
                 logger.success("LinkedIn login successful")
+                self._login_verified_at = time.time()
+                self._save_cookies()
                 return True
             else:
                 logger.error("LinkedIn login failed - unexpected redirect")
@@ -126,55 +528,36 @@ class LinkedInPoster(BaseSocialPoster):
             logger.error(f"LinkedIn login error: {e}")
             return False
     
-    def _navigate_to_post_creation(self) -> bool:
+    def _navigate_to_post_creation(self, reload_feed: bool = True) -> bool:
         """Navigate to LinkedIn post creation area."""
         try:
-            # Navigate to LinkedIn feed (as shown in the screenshot)
-            self.driver.get("https://www.linkedin.com/feed/")
-            self._add_random_delay(3, 5)
+            # Navigate to LinkedIn feed (as shown in the screenshot), unless we're already on it
+            if reload_feed or "feed" not in self.driver.current_url:
+                self.driver.get("https://www.linkedin.com/feed/")
             
             # Strategy 1: Use the specific button selector from user's guidance
-            start_post_selectors = [
-                "button.artdeco-button--muted.artdeco-button--tertiary",
-                "div[data-placeholder='Start a post']",
-                "div[aria-label='Start a post']",
-                "div[data-control-name='share.open']",
-                "div[data-control-name='create_post']",
-                "div[role='textbox'][data-placeholder*='post']",
-                "div[contenteditable='true'][data-placeholder*='post']"
-            ]
-            
-            for selector in start_post_selectors:
-                try:
-                    start_post_element = self.wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"Found 'Start a post' element with selector: {selector}")
-                    start_post_element.click()
-                    self._add_random_delay(2, 3)
-                    return True
-                except:
-                    continue
+            start_post_element = self._find_first('start_post', _START_POST_LOCATORS)
+            if start_post_element:
+                start_post_element.click()
+                return True
             
             # Strategy 2: Look for any element with "Start a post" text
             try:
-                start_post_element = self.driver.find_element(By.XPATH, "//div[contains(text(), 'Start a post') or contains(@data-placeholder, 'Start a post')]")
+                start_post_element = self.driver.find_element(By.XPATH, _START_POST_TEXT_XPATH)
                 logger.info("Found 'Start a post' element using XPath text search")
                 start_post_element.click()
-                self._add_random_delay(2, 3)
                 return True
             except:
                 pass
             
             # Strategy 3: Look for any clickable element containing "post"
             try:
-                elements = self.driver.find_elements(By.XPATH, "//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'start a post') or contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'create a post')]")
+                elements = self.driver.find_elements(By.XPATH, _START_POST_ANY_XPATH)
                 for element in elements:
                     try:
                         if element.is_displayed() and element.is_enabled():
                             logger.info(f"Found potential post element: {element.text[:50]}")
                             element.click()
-                            self._add_random_delay(2, 3)
                             return True
                     except:
                         continue
@@ -184,6 +567,9 @@ class LinkedInPoster(BaseSocialPoster):
             logger.error("Could not find LinkedIn 'Start a post' element")
             return False
             
+        except (ElementClickInterceptedException, StaleElementReferenceException):
+            # Transient; let post_content retry this step
+            raise
         except Exception as e:
             logger.error(f"Failed to navigate to post creation: {e}")
             return False
@@ -192,31 +578,15 @@ class LinkedInPoster(BaseSocialPoster):
         """Create the LinkedIn post with optional image."""
         try:
             # Wait for the modal to appear and find the text area (as shown in screenshot)
-            post_textarea_selectors = [
-                "div[data-placeholder='What do you want to talk about?']",
-                "div[aria-label='Text editor for creating content']",
-                "div[contenteditable='true'][data-placeholder*='talk about']",
-                "div[contenteditable='true'][data-placeholder*='want to']",
-                "div[role='textbox'][data-placeholder*='talk']",
-                "div[contenteditable='true']",
-                "div[role='textbox']"
-            ]
-            
-            post_textarea = None
-            for selector in post_textarea_selectors:
-                try:
-                    post_textarea = self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    logger.info(f"Found post textarea with selector: {selector}")
-                    break
-                except:
-                    continue
+            post_textarea = self._find_first(
+                'post_textarea', _POST_TEXTAREA_LOCATORS, _POST_TEXTAREA_FALLBACK_LOCATORS,
+                condition=EC.presence_of_element_located
+            )
             
             # If not found with CSS selectors, try XPath
             if not post_textarea:
                 try:
-                    post_textarea = self.driver.find_element(By.XPATH, "//div[contains(@data-placeholder, 'What do you want to talk about') or contains(@data-placeholder, 'talk about')]")
+                    post_textarea = self.driver.find_element(By.XPATH, _POST_TEXTAREA_XPATH)
                     logger.info("Found post textarea using XPath")
                 except:
                     pass
@@ -224,79 +594,51 @@ class LinkedInPoster(BaseSocialPoster):
             if not post_textarea:
                 raise Exception("Could not find LinkedIn post text area")
             
-            # Clear any existing text and enter caption
-            post_textarea.clear()
-            self._add_random_delay(1, 2)
-            
             # Clean caption to remove problematic Unicode characters that ChromeDriver can't handle
-            cleaned_caption = ''.join(char for char in caption if ord(char) < 0x10000)
+            cleaned_caption = _NON_BMP_RE.sub('', caption)
             logger.info(f"Cleaned caption length: {len(cleaned_caption)} characters (removed {len(caption) - len(cleaned_caption)} problematic characters)")
             
-            # Type the cleaned caption quickly (no slow character-by-character typing)
-            post_textarea.send_keys(cleaned_caption)
+            # If the composer already holds this exact caption, leave it as is
+            existing_text = (post_textarea.get_attribute('innerText') or '').rstrip()
+            if existing_text and existing_text == cleaned_caption.rstrip():
+                logger.info("Caption already present in the editor, skipping re-typing")
+            else:
+                # Clear any existing text and enter caption
+                post_textarea.clear()
+                
+                # Set the caption in a single WebDriver call instead of one keystroke per character
+                self._insert_caption(post_textarea, cleaned_caption)
             
-            self._add_random_delay(2, 3)
+            post_clicked = False
             
             # Add image if provided
             if image_path and os.path.exists(image_path):
                 try:
                     self._add_image_to_post(image_path)
-                    self._add_random_delay(2, 3)
                     
                     # After image upload and Next button click, now look for the Post button
                     logger.info("Looking for Post button after returning from image upload...")
                     
-                    # Strategy 1: Use the CSS selector as requested
-                    try:
-                        post_button = self.wait.until(
-                            EC.element_to_be_clickable(
-                                (By.CSS_SELECTOR, "button.share-actions__primary-action")
-                            )
-                        )
-                        logger.info("Found Post button using CSS selector")
-                    except TimeoutException:
-                        # Strategy 2: Use the working XPath method as fallback
+                    # Strategies 1-3: CSS selector as requested and CSS alternatives, then the XPath
+                    # text match and generic CSS fallbacks
+                    post_button = self._find_first('post_button', _POST_BUTTON_LOCATORS, _POST_BUTTON_FALLBACK_LOCATORS)
+                    
+                    # Strategy 4: Final fallback - search all buttons
+                    if not post_button:
                         try:
-                            post_button = self.wait.until(
-                                EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Post') or contains(@aria-label, 'Post')]"))
-                            )
-                            logger.info("Found Post button using working XPath method")
-                        except TimeoutException:
-                            # Strategy 3: Try CSS selectors as fallback
-                            post_button_selectors = [
-                                "button[aria-label='Post']",
-                                "button[data-control-name='share.post']",
-                                "button:contains('Post')",
-                                "button[type='submit']",
-                                "button[data-control-name='share.post_button']"
-                            ]
-                            
-                            for selector in post_button_selectors:
+                            buttons = self.driver.find_elements(By.XPATH, "//button")
+                            for button in buttons:
                                 try:
-                                    post_button = self.wait.until(
-                                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                                    )
-                                    logger.info(f"Found post button with selector: {selector}")
-                                    break
+                                    if button.is_displayed() and button.is_enabled():
+                                        button_text = button.text.lower()
+                                        if 'post' in button_text or 'submit' in button_text or 'share' in button_text:
+                                            logger.info(f"Found potential post button: {button.text}")
+                                            post_button = button
+                                            break
                                 except:
                                     continue
-                            
-                            # Strategy 4: Final fallback - search all buttons
-                            if not post_button:
-                                try:
-                                    buttons = self.driver.find_elements(By.XPATH, "//button")
-                                    for button in buttons:
-                                        try:
-                                            if button.is_displayed() and button.is_enabled():
-                                                button_text = button.text.lower()
-                                                if 'post' in button_text or 'submit' in button_text or 'share' in button_text:
-                                                    logger.info(f"Found potential post button: {button.text}")
-                                                    post_button = button
-                                                    break
-                                        except:
-                                            continue
-                                except:
-                                    pass
+                        except:
+                            pass
                     
                     if post_button:
                         # Wait for button to become enabled (LinkedIn might enable it after content is added)
@@ -313,6 +655,7 @@ class LinkedInPoster(BaseSocialPoster):
                         # Use JavaScript click to avoid any disabled state issues
                         logger.info("Clicking Post button to publish the post...")
                         self.driver.execute_script("arguments[0].click();", post_button)
+                        post_clicked = True
                         logger.info("Post button clicked successfully")
                     else:
                         raise Exception("Could not find LinkedIn post button")
@@ -321,8 +664,12 @@ class LinkedInPoster(BaseSocialPoster):
                     logger.warning(f"Failed to add image to LinkedIn post: {e}")
                     # Continue with text-only post
             
-            # Wait for post to complete
-            self._add_random_delay(3, 5)
+            # Wait for post to complete (the editor is removed once the share modal closes)
+            if post_clicked:
+                try:
+                    self._wait_for(EC.staleness_of(post_textarea))
+                except TimeoutException:
+                    logger.warning("Post editor still present after clicking Post")
             
             # Try to get the post URL (this might not be immediately available)
             try:
@@ -340,93 +687,98 @@ class LinkedInPoster(BaseSocialPoster):
                 logger.warning(f"Could not verify post URL: {e}")
                 return True, "linkedin_post_created"
                 
+        except (ElementClickInterceptedException, StaleElementReferenceException):
+            # Transient; let post_content retry this step
+            raise
         except Exception as e:
             logger.error(f"Failed to create LinkedIn post: {e}")
             return False, None
     
+    def _insert_caption(self, post_textarea, caption: str):
+        """Insert the caption into the post editor in a single browser round-trip."""
+        try:
+            # CDP insertText generates real input events, which LinkedIn's editor listens for
+            post_textarea.click()
+            self.driver.execute_cdp_cmd("Input.insertText", {"text": caption})
+        except Exception as e:
+            logger.warning(f"CDP text insertion failed ({e}), falling back to JavaScript")
+            # execCommand goes through the editor's own input handling; the explicit
+            # event covers editors that ignore it
+            self.driver.execute_script(
+                "const el = arguments[0];"
+                "el.focus();"
+                "document.execCommand('insertText', false, arguments[1]);"
+                "el.dispatchEvent(new InputEvent('input', {bubbles: true, inputType: 'insertText', data: arguments[1]}));",
+                post_textarea,
+                caption
+            )
+    
+    def _wait_for_element_async(self, css_selector: str, timeout: float = 20):
+        """Block until an element matching css_selector is in the DOM, using a MutationObserver."""
+        self.driver.set_script_timeout(timeout)
+        self.driver.execute_async_script(
+            """
+            var selector = arguments[0];
+            var callback = arguments[arguments.length - 1];
+            if (document.querySelector(selector)) {
+                callback(true);
+                return;
+            }
+            var observer = new MutationObserver(function() {
+                if (document.querySelector(selector)) {
+                    observer.disconnect();
+                    callback(true);
+                }
+            });
+            observer.observe(document.body, {childList: true, subtree: true, attributes: true, attributeFilter: ['src']});
+            """,
+            css_selector
+        )
+    
     def _add_image_to_post(self, image_path: str):
         """Add an image to the LinkedIn post."""
         try:
-            # Strategy 1: Use the specific "Add media" button selector from user's guidance
-            try:
-                media_button = self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "button[aria-label='Add media']"))
-                )
-                logger.info("Found Add media button using specific aria-label")
-                # Use JavaScript click to avoid element interception
-                self.driver.execute_script("arguments[0].click();", media_button)
-                self._add_random_delay(1, 2)
-            except TimeoutException:
-                # Strategy 2: Fallback to generic selectors
-                photo_button_selectors = [
-                    "button[aria-label='Photo']",
-                    "button[aria-label='Add a photo']",
-                    "button[data-control-name='share.add_photo']",
-                    "button[data-control-name='share.add_media']",
-                    "button:contains('Photo')",
-                    "button:contains('Add a photo')",
-                    "div[data-control-name='share.add_photo']"
-                ]
-                
-                photo_button = None
-                for selector in photo_button_selectors:
-                    try:
-                        photo_button = self.wait.until(
-                            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                        )
-                        logger.info(f"Found Photo button with selector: {selector}")
-                        break
-                    except:
-                        continue
-                
-                # If not found, try XPath search for "Photo" text
-                if not photo_button:
-                    try:
-                        photo_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Photo') or contains(text(), 'photo')]")
-                        logger.info("Found Photo button using XPath text search")
-                    except:
-                        pass
-                
-                if not photo_button:
-                    raise Exception("Could not find LinkedIn Photo button")
-                
-                photo_button.click()
-                self._add_random_delay(1, 2)
+            # Strategy 1: Use the specific "Add media" button selector from user's guidance,
+            # Strategy 2: Fallback to generic selectors
+            media_button = self._find_first('media_button', _MEDIA_BUTTON_LOCATORS, _MEDIA_BUTTON_FALLBACK_LOCATORS)
+            
+            # If not found, try XPath search for "Photo" text
+            if not media_button:
+                try:
+                    media_button = self.driver.find_element(By.XPATH, _PHOTO_BUTTON_XPATH)
+                    logger.info("Found Photo button using XPath text search")
+                except:
+                    pass
+            
+            if not media_button:
+                raise Exception("Could not find LinkedIn Photo button")
+            
+            # Use JavaScript click to avoid element interception
+            self.driver.execute_script("arguments[0].click();", media_button)
             
             # Wait for the file upload dialog to appear
             logger.info("Waiting for file upload dialog to appear...")
-            self._add_random_delay(2, 3)
             
-            # Strategy 1: Use the specific file input selector from user's guidance
-            try:
-                file_input = self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input#media-editor-file-selector_file-input"))
-                )
-                logger.info("Found file input using specific ID selector")
-            except TimeoutException:
-                # Strategy 2: Fallback to generic file input
-                try:
-                    file_input = self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='file']"))
-                    )
-                    logger.info("Found file input using generic type selector")
-                except TimeoutException:
-                    raise Exception("Could not find file input element")
+            # Strategy 1: Use the specific file input selector from user's guidance,
+            # Strategy 2: Fallback to generic file input
+            file_input = self._find_first(
+                'file_input', _FILE_INPUT_LOCATORS, _FILE_INPUT_FALLBACK_LOCATORS,
+                condition=EC.presence_of_element_located, timeout=5
+            )
+            if not file_input:
+                raise Exception("Could not find file input element")
             
             # Send the image file path
             file_input.send_keys(os.path.abspath(image_path))
             logger.info(f"Sent image file path: {os.path.abspath(image_path)}")
             
-            # Wait longer for image to upload and process
+            # Wait for image to upload and process
             logger.info("Waiting for image to upload and process...")
-            self._add_random_delay(5, 8)
             
             # Wait for the image preview to appear (this indicates successful upload)
             try:
-                # Look for the image preview in the editor
-                self.wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "img[src*='blob:']"))
-                )
+                # Look for the image preview in the editor, woken by a MutationObserver instead of polling
+                self._wait_for_element_async("img[src*='blob:']", timeout=20)
                 logger.info("Image preview found - upload successful")
             except TimeoutException:
                 # Alternative: look for any image element
@@ -445,40 +797,11 @@ class LinkedInPoster(BaseSocialPoster):
                 # Wait for the Next button to appear and be clickable
                 logger.info("Looking for Next button after image upload...")
                 
-                # Wait a bit more for the UI to settle after image upload
-                self._add_random_delay(2, 3)
-                
-                # Strategy 1: Use the specific aria-label selector
-                try:
-                    next_button = self.wait.until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "div.share-box-footer.main-actions button[aria-label='Next']"))
-                    )
-                    logger.info("Found Next button using aria-label selector")
-                except TimeoutException:
-                    logger.info("Next button not found with aria-label, trying other strategies...")
-                    # Strategy 2: Look for button with Next text
-                    try:
-                        next_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Next')]")
-                        logger.info("Found Next button using text search")
-                    except NoSuchElementException:
-                        logger.info("Next button not found with text search, trying class selector...")
-                        # Strategy 3: Look for button with specific class (from user's HTML)
-                        try:
-                            next_button = self.driver.find_element(By.CSS_SELECTOR, "button.share-box-footer_primary-btn")
-                            logger.info("Found Next button using share-box-footer_primary-btn class selector")
-                        except NoSuchElementException:
-                            logger.info("Next button not found with class selector, trying footer text search...")
-                            # Strategy 4: Look for button with Next text in share-box-footer
-                            try:
-                                next_button = self.driver.find_element(By.XPATH, "//div[contains(@class, 'share-box-footer')]//button[contains(text(), 'Next')]")
-                                logger.info("Found Next button using share-box-footer text search")
-                            except NoSuchElementException:
-                                # Strategy 5: Look for any button with Next text anywhere
-                                try:
-                                    next_button = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Next') or contains(@aria-label, 'Next')]")
-                                    logger.info("Found Next button using general search")
-                                except NoSuchElementException:
-                                    raise Exception("Could not find Next button with any selector")
+                # Strategies 1-5: aria-label, footer class (from user's HTML), Next text in
+                # share-box-footer, then Next text or aria-label on any button anywhere
+                next_button = self._find_first('next_button', _NEXT_BUTTON_LOCATORS, _NEXT_BUTTON_FALLBACK_LOCATORS)
+                if not next_button:
+                    raise Exception("Could not find Next button with any selector")
                 
                 # Click the Next button
                 if next_button:
@@ -486,8 +809,7 @@ class LinkedInPoster(BaseSocialPoster):
                     logger.info("Clicking Next button to proceed to post...")
                     # Use JavaScript click to avoid any interception issues
                     self.driver.execute_script("arguments[0].click();", next_button)
-                    self._add_random_delay(3, 5)  # Wait longer for the transition
-                    logger.info("Successfully clicked Next button and waiting for transition")
+                    logger.info("Successfully clicked Next button")
                 else:
                     raise Exception("Next button found but not clickable")
                     
@@ -500,26 +822,21 @@ class LinkedInPoster(BaseSocialPoster):
             logger.error(f"Failed to add image to LinkedIn post: {e}")
             raise
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def post_content(self, caption: str, job_data: Dict[str, Any], image_path: Optional[str] = None) -> Tuple[bool, Optional[str]]:
         """Post content to LinkedIn with optional image."""
         try:
             # Ensure we're logged in
-            if not self._is_logged_in():
-                if not self._login():
-                    return False, "login_failed"
-            
-            # Navigate to post creation
-            if not self._navigate_to_post_creation():
-                return False, "navigation_failed"
+            if not self._ensure_logged_in():
+                return False, "login_failed"
             
-            # Create the post
-            success, post_id = self._create_post(caption, job_data, image_path)
+            # The feed was just loaded by the login check
+            success, post_id = self._post_with_retry(caption, job_data, image_path)
             
             if success:
                 logger.info(f"LinkedIn post created for job: {job_data.get('title', 'Unknown')}")
             else:
                 logger.error(f"LinkedIn post failed for job: {job_data.get('title', 'Unknown')}")
+                self._login_verified_at = None
             
             return success, post_id
             
@@ -527,30 +844,145 @@ class LinkedInPoster(BaseSocialPoster):
             logger.error(f"LinkedIn posting error: {e}")
             return False, str(e)
     
+    def _post_with_retry(self, caption: str, job_data: Dict[str, Any],
+                         image_path: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+        """Publish a single post from the current feed page, retrying when the page changes under a click."""
+        for attempt in range(POST_ATTEMPTS):
+            try:
+                # Retries start from a freshly loaded feed
+                return self._post_once(caption, job_data, image_path, reload_feed=attempt > 0)
+            except (ElementClickInterceptedException, StaleElementReferenceException) as e:
+                if attempt == POST_ATTEMPTS - 1:
+                    raise
+                logger.warning(f"LinkedIn post attempt {attempt + 1} hit a transient error, retrying: {e}")
+                time.sleep(0.5 * (attempt + 1))
+                
+                # Only log in again if the session cookie has actually gone
+                self._login_verified_at = None
+                if not self._is_logged_in() and not self._login():
+                    return False, "login_failed"
+    
+    def _post_once(self, caption: str, job_data: Dict[str, Any], image_path: Optional[str] = None,
+                   reload_feed: bool = True) -> Tuple[bool, Optional[str]]:
+        """Open the post composer and publish a single post, assuming we're logged in."""
+        if not self._navigate_to_post_creation(reload_feed=reload_feed):
+            return False, "navigation_failed"
+        
+        return self._create_post(caption, job_data, image_path)
+    
+    def post_batch(self, items: List[Tuple[str, Dict[str, Any], Optional[str]]],
+                   delay_range: Tuple[float, float] = (0, 0),
+                   on_result: Optional[Callable[[int, Tuple[bool, Optional[str]]], None]] = None
+                   ) -> List[Tuple[bool, Optional[str]]]:
+        """Post several (caption, job_data, image_path) items in one LinkedIn session."""
+        results = []
+        check_login = True
+        
+        for index, (caption, job_data, image_path) in enumerate(items):
+            if index and delay_range[1] > 0:
+                self._add_random_delay(*delay_range)
+            
+            try:
+                # Login state is only re-checked for the first item or after a failure
+                if check_login:
+                    if not self._ensure_logged_in():
+                        self._record_result(results, (False, "login_failed"), on_result)
+                        continue
+                    check_login = False
+                
+                # Reuse the feed page from the login check or the previous post
+                success, post_id = self._post_with_retry(caption, job_data, image_path)
+                self._record_result(results, (success, post_id), on_result)
+                
+                if success:
+                    logger.info(f"LinkedIn post created for job: {job_data.get('title', 'Unknown')}")
+                    
+                    # Let the share modal close so the next post starts from the same feed page
+                    try:
+                        self._wait_for(EC.invisibility_of_element_located((By.CSS_SELECTOR, "div[role='dialog']")), timeout=10)
+                    except TimeoutException:
+                        logger.warning("Share modal still open, reloading the feed for the next post")
+                        check_login = True
+                else:
+                    logger.error(f"LinkedIn post failed for job: {job_data.get('title', 'Unknown')}")
+                    self._login_verified_at = None
+                    check_login = True
+                    
+            except Exception as e:
+                logger.error(f"LinkedIn batch posting error: {e}")
+                self._record_result(results, (False, str(e)), on_result)
+                self._login_verified_at = None
+                check_login = True
+        
+        logger.info(f"LinkedIn batch completed: {sum(1 for success, _ in results if success)}/{len(items)} posted")
+        return results
+    
+    def _ensure_logged_in(self) -> bool:
+        """Load the feed and only run the login flow if the saved session isn't valid."""
+        self.driver.get("https://www.linkedin.com/feed/")
+        if self._on_feed() and self._is_logged_in():
+            return True
+        
+        # The browser profile has no valid session; fall back to the cookies saved by an earlier login
+        if self._load_cookies() and self._on_feed() and self._is_logged_in():
+            return True
+        return self._login()
+    
+    def _on_feed(self) -> bool:
+        """Check the feed actually loaded; a revoked session redirects to /login or an authwall."""
+        if "feed" in self.driver.current_url:
+            return True
+        self._login_verified_at = None
+        return False
+    
     def _is_logged_in(self) -> bool:
         """Check if currently logged into LinkedIn."""
-        try:
-            # Check for elements that indicate we're logged in
-            self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Start a post']")
+        # Trust a recent confirmation; failures reset it so the session is re-checked
+        if self._login_verified_at and time.time() - self._login_verified_at < LOGIN_CHECK_TTL_SECONDS:
             return True
-        except NoSuchElementException:
-            return False
+        
+        # LinkedIn's session cookie is present exactly when we're logged in
+        if any(cookie.get('name') == 'li_at' for cookie in self.driver.get_cookies()):
+            self._login_verified_at = time.time()
+            return True
+        return False
     
     def close(self):
         """Close the browser driver."""
         if self.driver:
             self.driver.quit()
             logger.info("LinkedIn driver closed")
+        if self._temp_profile_dir:
+            shutil.rmtree(self._temp_profile_dir, ignore_errors=True)
+            self._temp_profile_dir = None
 class SocialPosterManager:
     """Manages all social media posters."""
     
-    def __init__(self, config_path: str = "config.yaml"):
-        """Initialize the poster manager."""
-        with open(config_path, 'r') as file:
-            self.config = yaml.safe_load(file)
+    def __init__(self, config_path: str = "config.yaml", prewarm: bool = False):
+        """Initialize the poster manager.
+        
+        With prewarm=True, browsers are started in a background thread so their
+        startup overlaps with whatever the caller does before posting.
+        """
+        self.config = _load_config(config_path)
         
         self.posters = {}
         self._posters_initialized = False  # Don't initialize immediately
+        self._prewarm_thread = None
+        
+        if prewarm:
+            self.prewarm()
+    
+    def prewarm(self):
+        """Start initializing posters in a background thread, unless already started or done."""
+        if self._posters_initialized or self._prewarm_thread is not None:
+            return
+        
+        platforms = self.config.get('posting', {}).get('platforms', [])
+        if 'linkedin' in platforms:
+            self._prewarm_thread = threading.Thread(target=self._initialize_posters, daemon=True)
+            self._prewarm_thread.start()
+            logger.info("Pre-warming social media posters in background")
     
     def _initialize_posters(self):
         """Initialize all enabled social media posters."""
@@ -569,8 +1001,15 @@ class SocialPosterManager:
         self._posters_initialized = True
         logger.info(f"Initialized {len(self.posters)} social media posters")
     
+    def _join_prewarm(self):
+        """Wait for a background pre-warm, if one was started."""
+        if self._prewarm_thread is not None:
+            self._prewarm_thread.join()
+            self._prewarm_thread = None
+    
     def _ensure_posters_initialized(self):
         """Ensure posters are initialized before use."""
+        self._join_prewarm()
         if not self._posters_initialized:
             self._initialize_posters()
     
@@ -581,29 +1020,99 @@ class SocialPosterManager:
         
         results = {}
         
-        for platform, poster in self.posters.items():
-            if platform in captions:
-                try:
-                    caption = captions[platform]
-                    success, post_id = poster.post_content(caption, job_data, image_path)
-                    results[platform] = (success, post_id)
-                    
-                    if success:
-                        logger.info(f"Successfully posted to {platform}")
+        # Each poster drives its own browser, so platforms can post concurrently
+        if self.posters:
+            with ThreadPoolExecutor(max_workers=len(self.posters)) as executor:
+                futures = {}
+                for platform, poster in self.posters.items():
+                    if platform in captions:
+                        future = executor.submit(poster.post_content, captions[platform], job_data, image_path)
+                        futures[future] = platform
                     else:
-                        logger.error(f"Failed to post to {platform}: {post_id}")
+                        logger.warning(f"No caption available for {platform}")
+                        results[platform] = (False, "no_caption")
+                
+                for future in as_completed(futures):
+                    platform = futures[future]
+                    try:
+                        success, post_id = future.result()
+                        results[platform] = (success, post_id)
                         
-                except Exception as e:
-                    logger.error(f"Error posting to {platform}: {e}")
-                    results[platform] = (False, str(e))
-            else:
-                logger.warning(f"No caption available for {platform}")
-                results[platform] = (False, "no_caption")
+                        if success:
+                            logger.info(f"Successfully posted to {platform}")
+                        else:
+                            logger.error(f"Failed to post to {platform}: {post_id}")
+                            
+                    except Exception as e:
+                        logger.error(f"Error posting to {platform}: {e}")
+                        results[platform] = (False, str(e))
+        
+        return results
+    
+    def post_batch(self, jobs: List[Tuple[Dict[str, str], Dict[str, Any], Optional[str]]],
+                   delay_range: Tuple[float, float] = (0, 0),
+                   on_result: Optional[Callable[[int, str, Tuple[bool, Optional[str]]], None]] = None
+                   ) -> List[Dict[str, Tuple[bool, Optional[str]]]]:
+        """Post a list of (captions, job_data, image_path) jobs, one session per platform.
+        
+        Jobs are grouped per platform and handed to each poster's post_batch, so
+        login and page loads are paid once per platform rather than once per job.
+        Each poster waits a random delay_range seconds between its posts, and
+        on_result(job_index, platform, result) is called as each post finishes
+        (possibly from a worker thread).
+        """
+        self._ensure_posters_initialized()
+        
+        results = [{} for _ in jobs]
+        
+        if self.posters:
+            with ThreadPoolExecutor(max_workers=len(self.posters)) as executor:
+                futures = {}
+                for platform, poster in self.posters.items():
+                    indexes = []
+                    items = []
+                    for index, (captions, job_data, image_path) in enumerate(jobs):
+                        if platform in captions:
+                            indexes.append(index)
+                            items.append((captions[platform], job_data, image_path))
+                        else:
+                            logger.warning(f"No caption available for {platform}")
+                            results[index][platform] = (False, "no_caption")
+                    
+                    if items:
+                        report = None
+                        if on_result:
+                            # Map the poster's item index back to the job index
+                            report = functools.partial(self._report_result, on_result, platform, indexes)
+                        future = executor.submit(poster.post_batch, items, delay_range, report)
+                        futures[future] = (platform, indexes)
+                
+                for future in as_completed(futures):
+                    platform, indexes = futures[future]
+                    try:
+                        batch_results = future.result()
+                        for index, result in zip(indexes, batch_results):
+                            results[index][platform] = result
+                        
+                        posted = sum(1 for success, _ in batch_results if success)
+                        logger.info(f"Posted {posted}/{len(indexes)} jobs to {platform}")
+                        
+                    except Exception as e:
+                        logger.error(f"Error batch posting to {platform}: {e}")
+                        for index in indexes:
+                            results[index][platform] = (False, str(e))
         
         return results
     
+    @staticmethod
+    def _report_result(on_result: Callable[[int, str, Tuple[bool, Optional[str]]], None], platform: str,
+                       indexes: List[int], item_index: int, result: Tuple[bool, Optional[str]]):
+        """Forward a poster's per-item result to on_result under its job index."""
+        on_result(indexes[item_index], platform, result)
+    
     def close_all_posters(self):
         """Close all poster resources."""
+        self._join_prewarm()
         for platform, poster in self.posters.items():
             try:
                 if hasattr(poster, 'close'):
@@ -611,3 +1120,23 @@ class SocialPosterManager:
                 logger.info(f"Closed {platform} poster")
             except Exception as e:
                 logger.error(f"Error closing {platform} poster: {e}")
+        
+        # Allow a shared manager to re-create posters on its next use
+        self.posters = {}
+        self._posters_initialized = False
+
+# Shared managers keyed by absolute config path
+_MANAGER_SINGLETONS: Dict[str, SocialPosterManager] = {}
+
+def get_manager(config_path: str = "config.yaml", prewarm: bool = False) -> SocialPosterManager:
+    """Return the process-wide SocialPosterManager for a config file, creating it on first use."""
+    key = os.path.abspath(config_path)
+    manager = _MANAGER_SINGLETONS.get(key)
+    if manager is None:
+        manager = SocialPosterManager(key, prewarm=prewarm)
+        _MANAGER_SINGLETONS[key] = manager
+        # Make sure browsers are shut down even if the caller never closes them
+        atexit.register(manager.close_all_posters)
+    elif prewarm:
+        manager.prewarm()
+    return manager
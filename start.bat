@@ -1,20 +1,4 @@
 @echo off
-echo Job Automation System - Startup Menu
-echo ========================================
-echo.
-echo Available commands:
-echo 1. python cli.py init
-echo 2. python cli.py fetch
-echo 3. python cli.py post
-echo 4. python cli.py list-jobs
-echo 5. python cli.py list-posts
-echo 6. python cli.py analytics
-echo 7. python cli.py status
-echo 8. python test_system.py
-echo 9. python test_gemini.py
-echo.
-echo To start the system, run: python cli.py init
-echo Then fetch jobs: python cli.py fetch
-echo Then post to LinkedIn: python cli.py post
+python start.py
 echo.
 pause
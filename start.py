@@ -3,25 +3,39 @@
 Simple startup script for the Job Automation System.
 """
 
+import sys
+
+HEADER = (
+    "Job Automation System - Startup Menu",
+    "=" * 40,
+    "",
+    "Available commands:",
+)
+
+COMMANDS = (
+    "python cli.py init",
+    "python cli.py fetch",
+    "python cli.py post",
+    "python cli.py list-jobs",
+    "python cli.py list-posts",
+    "python cli.py analytics",
+    "python cli.py status",
+    "python test_system.py",
+    "python test_gemini.py",
+    "python monthly_cleanup.py (Monthly cleanup)",
+)
+
+FOOTER = (
+    "",
+    "To start the system, run: python cli.py init",
+    "Then fetch jobs: python cli.py fetch",
+    "Then post to LinkedIn: python cli.py post",
+)
+
 def main():
-    print("Job Automation System - Startup Menu")
-    print("=" * 40)
-    print()
-    print("Available commands:")
-    print("1. python cli.py init")
-    print("2. python cli.py fetch")
-    print("3. python cli.py post")
-    print("4. python cli.py list-jobs")
-    print("5. python cli.py list-posts")
-    print("6. python cli.py analytics")
-    print("7. python cli.py status")
-    print("8. python test_system.py")
-    print("9. python test_gemini.py")
-    print("10. python monthly_cleanup.py (Monthly cleanup)")
-    print()
-    print("To start the system, run: python cli.py init")
-    print("Then fetch jobs: python cli.py fetch")
-    print("Then post to LinkedIn: python cli.py post")
+    numbered = tuple(f"{i}. {command}" for i, command in enumerate(COMMANDS, 1))
+    # Emit the whole menu in a single write
+    sys.stdout.write("\n".join(HEADER + numbered + FOOTER) + "\n")
 
 if __name__ == "__main__":
     main()
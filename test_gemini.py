@@ -2,36 +2,57 @@
 Test script to verify Gemini API integration.
 """
 import os
+import re
 import sys
+from functools import lru_cache
 from loguru import logger
 
+# Import once at module load; the tests share this reference
+try:
+    import google.generativeai as genai
+    _GENAI_IMPORT_ERROR = None
+except ImportError as e:
+    genai = None
+    _GENAI_IMPORT_ERROR = e
+
+# Same key format check as test_system.API_KEY_RE
+_API_KEY_RE = re.compile(r'AIza[0-9A-Za-z_-]{35}')
+
+@lru_cache(maxsize=4)
+def _model(api_key, name='gemini-pro'):
+    """Configure Gemini and build a model once per (api_key, name)."""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(name)
+
 def test_gemini_import():
     """Test Gemini API import."""
-    try:
-        import google.generativeai as genai
-        logger.success("✓ google-generativeai imported successfully")
-        return True
-    except ImportError as e:
-        logger.error(f"✗ Failed to import google-generativeai: {e}")
+    if genai is None:
+        logger.error(f"✗ Failed to import google-generativeai: {_GENAI_IMPORT_ERROR}")
         return False
+    
+    logger.success("✓ google-generativeai imported successfully")
+    return True
 
 def test_gemini_configuration():
     """Test Gemini API configuration."""
+    if genai is None:
+        logger.error("✗ Gemini configuration failed: google-generativeai not installed")
+        return False
+    
     try:
-        import google.generativeai as genai
-        
         # Check if API key is set
         api_key = os.getenv('GOOGLE_API_KEY')
         if not api_key:
             logger.warning("⚠ GOOGLE_API_KEY not set in environment")
             return False
         
-        # Configure Gemini
-        genai.configure(api_key=api_key)
-        logger.success("✓ Gemini API configured successfully")
+        if not _API_KEY_RE.fullmatch(api_key):
+            logger.error("✗ GOOGLE_API_KEY format invalid")
+            return False
         
-        # Test model initialization
-        model = genai.GenerativeModel('gemini-pro')
+        # Configure Gemini and test model initialization
+        model = _model(api_key)
+        logger.success("✓ Gemini API configured successfully")
         logger.success("✓ Gemini Pro model initialized successfully")
         
         return True
@@ -42,16 +63,21 @@ def test_gemini_configuration():
 
 def test_gemini_text_generation():
     """Test basic text generation with Gemini."""
+    if genai is None:
+        logger.error("✗ Gemini text generation test failed: google-generativeai not installed")
+        return False
+    
     try:
-        import google.generativeai as genai
-        
         api_key = os.getenv('GOOGLE_API_KEY')
         if not api_key:
             logger.warning("⚠ GOOGLE_API_KEY not set, skipping text generation test")
             return True
         
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-pro')
+        if not _API_KEY_RE.fullmatch(api_key):
+            logger.error("✗ Gemini text generation test failed: GOOGLE_API_KEY format invalid")
+            return False
+        
+        model = _model(api_key)
         
         # Simple test prompt
         prompt = "Generate a short, professional job posting caption for a Python developer position."
@@ -6,7 +6,14 @@ Tests all major components and dependencies.
 
 import sys
 import os
+import io
+import re
+import asyncio
+import threading
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 # Load environment variables from .env file
 try:
@@ -16,86 +23,95 @@ try:
 except ImportError:
     print("⚠ python-dotenv not installed, environment variables may not be loaded")
 
-def test_imports():
-    """Test all required package imports."""
-    print("Testing package imports...")
-    
-    try:
-        import requests
-        print("✓ requests")
-    except ImportError:
-        print("✗ requests - Install with: pip install requests")
-        return False
-    
-    try:
-        import yaml
-        print("✓ PyYAML")
-    except ImportError:
-        print("✗ PyYAML - Install with: pip install PyYAML")
-        return False
-    
-    try:
-        import loguru
-        print("✓ loguru")
-    except ImportError:
-        print("✗ loguru - Install with: pip install loguru")
-        return False
-    
-    try:
-        import tenacity
-        print("✓ tenacity")
-    except ImportError:
-        print("✗ tenacity - Install with: pip install tenacity")
-        return False
-    
-    try:
-        import pymongo
-        print("✓ pymongo")
-    except ImportError:
-        print("✗ pymongo - Install with: pip install pymongo")
-        return False
-    
+# Snapshot the credentials the tests read, after .env has been applied
+ENV = {key: os.environ.get(key) for key in (
+    'GOOGLE_API_KEY',
+    'LINKEDIN_EMAIL',
+    'LINKEDIN_PASSWORD',
+    'RAPIDAPI_KEY',
+    'JOOBLE_API_KEY',
+)}
+
+# (module to import, package name used in messages and pip install)
+REQUIRED_PACKAGES = [
+    ("requests", "requests"),
+    ("yaml", "PyYAML"),
+    ("loguru", "loguru"),
+    ("tenacity", "tenacity"),
+    ("pymongo", "pymongo"),
+    ("google.generativeai", "google-generativeai"),
+    ("PIL.Image", "Pillow"),
+    ("selenium", "selenium"),
+    ("apscheduler", "APScheduler"),
+]
+
+# Google API keys are "AIza" followed by 35 URL-safe characters
+API_KEY_RE = re.compile(r'AIza[0-9A-Za-z_-]{35}')
+
+# Top-level sections every component expects to find in config.yaml
+REQUIRED_SECTIONS = frozenset({'job_filters', 'posting', 'job_sources', 'database', 'logging'})
+
+def _is_installed(module_name):
+    """Check a module can be found without importing (and initializing) it."""
     try:
-        import google.generativeai
-        print("✓ google-generativeai")
+        return importlib.util.find_spec(module_name) is not None
     except ImportError:
-        print("✗ google-generativeai - Install with: pip install google-generativeai")
+        # Raised when a parent package (e.g. 'google') is missing
         return False
+
+# Packages each test needs; a test is skipped when any of them is missing
+DEPS = {
+    "Configuration": ["yaml"],
+    "MongoDB Connection": ["pymongo"],
+    "Gemini API": ["google.generativeai"],
+    "Image Generation": ["loguru", "google.generativeai", "PIL.Image", "requests", "yaml", "tenacity"],
+}
+
+@lru_cache(maxsize=None)
+def _available_packages():
+    """Return {module name: installed?} for REQUIRED_PACKAGES, probed once per run."""
+    module_names = [module_name for module_name, _ in REQUIRED_PACKAGES]
+    # Lookups are mostly file I/O, so probing them in parallel cuts wall time
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return dict(zip(module_names, executor.map(_is_installed, module_names)))
+
+def test_imports():
+    """Test all required package imports."""
+    print("Testing package imports...")
     
-    try:
-        from PIL import Image
-        print("✓ Pillow")
-    except ImportError:
-        print("✗ Pillow - Install with: pip install Pillow")
-        return False
+    available = _available_packages()
     
-    try:
-        import selenium
-        print("✓ selenium")
-    except ImportError:
-        print("✗ selenium - Install with: pip install selenium")
-        return False
+    all_imported = True
+    for module_name, package in REQUIRED_PACKAGES:
+        if available[module_name]:
+            print(f"✓ {package}")
+        else:
+            print(f"✗ {package} - Install with: pip install {package}")
+            all_imported = False
     
-    try:
-        import apscheduler
-        print("✓ APScheduler")
-    except ImportError:
-        print("✗ APScheduler - Install with: pip install APScheduler")
-        return False
+    return all_imported
+
+def _scan_cwd():
+    """List the working directory as {name: DirEntry}.
     
-    return True
+    DirEntry caches file type information from the directory listing, so
+    existence and is_dir() checks need no further stat calls.
+    """
+    return {entry.name: entry for entry in os.scandir('.')}
 
 def test_config_files():
     """Test configuration files exist."""
     print("\nTesting configuration files...")
     
-    if os.path.exists('.env'):
+    entries = _scan_cwd()
+    
+    if '.env' in entries:
         print("✓ .env file exists")
     else:
         print("✗ .env file missing - Create from env.template")
         return False
     
-    if os.path.exists('config.yaml'):
+    if 'config.yaml' in entries:
         print("✓ config.yaml exists")
     else:
         print("✗ config.yaml missing")
@@ -103,16 +119,59 @@ def test_config_files():
     
     return True
 
+def test_configuration():
+    """Test config.yaml parses."""
+    print("\nTesting configuration...")
+    
+    try:
+        import yaml
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader
+        
+        with open('config.yaml', 'r') as file:
+            config = yaml.load(file, Loader=Loader)
+    except Exception as e:
+        print(f"✗ config.yaml could not be parsed: {e}")
+        return False
+    
+    if not isinstance(config, dict):
+        print("✗ config.yaml does not contain a mapping")
+        return False
+    
+    missing = REQUIRED_SECTIONS - config.keys()
+    if missing:
+        print(f"✗ config.yaml missing sections: {sorted(missing)}")
+        return False
+    
+    print("✓ config.yaml parsed successfully, all required sections present")
+    return True
+
+_client = None
+
+def get_client():
+    """Return the shared MongoClient, connecting on first use."""
+    global _client
+    if _client is None:
+        from pymongo import MongoClient
+        _client = MongoClient('mongodb://localhost:27017', serverSelectionTimeoutMS=5000)
+    return _client
+
+def close_client():
+    """Close the shared MongoClient if one was opened."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
 def test_mongodb_connection():
     """Test MongoDB connectivity."""
     print("\nTesting MongoDB connection...")
     
     try:
-        import pymongo
-        from pymongo import MongoClient
-        
         # Try to connect to MongoDB
-        client = MongoClient('mongodb://localhost:27017', serverSelectionTimeoutMS=5000)
+        client = get_client()
         client.admin.command('ping')
         print("✓ MongoDB connection successful")
         
@@ -121,7 +180,6 @@ def test_mongodb_connection():
         collections = db.list_collection_names()
         print(f"✓ Database 'job_automation' accessible, collections: {collections}")
         
-        client.close()
         return True
         
     except Exception as e:
@@ -137,11 +195,16 @@ def test_gemini_api():
         import google.generativeai as genai
         
         # Check if API key is set
-        api_key = os.getenv('GOOGLE_API_KEY')
+        api_key = ENV['GOOGLE_API_KEY']
         if not api_key:
             print("✗ GOOGLE_API_KEY not set in environment")
             return False
         
+        # Catch obviously malformed keys before any network round-trip
+        if not API_KEY_RE.fullmatch(api_key):
+            print("✗ GOOGLE_API_KEY format invalid")
+            return False
+        
         # Initialize Gemini
         genai.configure(api_key=api_key)
         
@@ -171,8 +234,8 @@ def test_linkedin_credentials():
     """Test LinkedIn credentials."""
     print("\nTesting LinkedIn credentials...")
     
-    linkedin_email = os.getenv('LINKEDIN_EMAIL')
-    linkedin_password = os.getenv('LINKEDIN_PASSWORD')
+    linkedin_email = ENV['LINKEDIN_EMAIL']
+    linkedin_password = ENV['LINKEDIN_PASSWORD']
     
     if linkedin_email and linkedin_password:
         print("✓ LinkedIn credentials found")
@@ -185,8 +248,8 @@ def test_job_sources():
     """Test job source configuration."""
     print("\nTesting job source configuration...")
     
-    rapidapi_key = os.getenv('RAPIDAPI_KEY')
-    jooble_key = os.getenv('JOOBLE_API_KEY')
+    rapidapi_key = ENV['RAPIDAPI_KEY']
+    jooble_key = ENV['JOOBLE_API_KEY']
     
     sources_found = []
     if rapidapi_key:
@@ -201,6 +264,44 @@ def test_job_sources():
         print("✗ No job sources configured - Set RAPIDAPI_KEY and/or JOOBLE_API_KEY")
         return False
 
+class _ThreadStdout(io.TextIOBase):
+    """stdout proxy that lets each worker thread collect its own output."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def capture(self):
+        self._local.buffer = io.StringIO()
+    
+    def collect(self):
+        buffer = self._local.__dict__.pop('buffer', None)
+        return buffer.getvalue() if buffer else ''
+    
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self._stream).write(text)
+    
+    def flush(self):
+        self._stream.flush()
+
+def _run_test(stdout, test_name, test_func):
+    """Run one test in the current thread, returning (passed, captured output)."""
+    stdout.capture()
+    try:
+        passed = bool(test_func())
+    except Exception as e:
+        print(f"✗ {test_name} test failed with exception: {e}")
+        passed = False
+    return passed, stdout.collect()
+
+async def _run_tests(stdout, tests):
+    """Run the tests concurrently so their network timeouts overlap."""
+    return await asyncio.gather(*[
+        asyncio.to_thread(_run_test, stdout, test_name, test_func)
+        for test_name, test_func in tests
+    ])
+
 def main():
     """Run all tests."""
     print("Job Automation System - System Test")
@@ -209,6 +310,7 @@ def main():
     tests = [
         ("Package Imports", test_imports),
         ("Configuration Files", test_config_files),
+        ("Configuration", test_configuration),
         ("MongoDB Connection", test_mongodb_connection),
         ("Gemini API", test_gemini_api),
         ("Image Generation", test_image_generation),
@@ -216,18 +318,41 @@ def main():
         ("Job Sources", test_job_sources),
     ]
     
-    passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-        except Exception as e:
-            print(f"✗ {test_name} test failed with exception: {e}")
+    # Don't run tests whose packages are missing; test_imports already reports them
+    available = _available_packages()
+    missing = {
+        test_name: [dep for dep in DEPS.get(test_name, []) if not available[dep]]
+        for test_name, _ in tests
+    }
+    runnable = [(test_name, test_func) for test_name, test_func in tests if not missing[test_name]]
+    
+    # Output is buffered per test and replayed in order, so it doesn't interleave
+    stdout = _ThreadStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        results = dict(zip(
+            [test_name for test_name, _ in runnable],
+            asyncio.run(_run_tests(stdout, runnable)),
+        ))
+    finally:
+        sys.stdout = stdout._stream
+        close_client()
+    
+    passed = 0
+    skipped = 0
+    for test_name, _ in tests:
+        if missing[test_name]:
+            print(f"\n⚠ {test_name} test skipped - missing: {', '.join(missing[test_name])}")
+            skipped += 1
+            continue
+        test_passed, output = results[test_name]
+        sys.stdout.write(output)
+        passed += test_passed
     
     print("\n" + "=" * 40)
-    print(f"Test Results: {passed}/{total} tests passed")
+    print(f"Test Results: {passed}/{total} tests passed" + (f" ({skipped} skipped)" if skipped else ""))
     
     if passed == total:
         print("🎉 All tests passed! System is ready to use.")